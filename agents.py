@@ -3,9 +3,208 @@ Multi-Agent System Implementation
 Contains the three specialized agents: Planner, Search, and Synthesizer
 """
 
+import asyncio
+import functools
+import logging
 import google.generativeai as genai
-from typing import List, Tuple
-import re
+from typing import Callable, List, Optional, Tuple
+import ast
+import json
+from cache import cached, cached_many, cached_generate, cached_generate_async, lookup_response, store_response
+from limits import call_with_backoff, call_with_backoff_async
+
+logger = logging.getLogger(__name__)
+
+# Line prefixes that mark a question in a non-JSON planner response
+_LINE_STARTS = ('1.', '2.', '3.', '4.', '5.', '-', '*')
+_BULLETS = ('-', '*')
+
+# Ask Gemini for the research plan as a JSON array of strings
+_PLAN_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "ARRAY", "items": {"type": "STRING"}},
+}
+
+# Structured output for batched answers: a JSON array of strings
+_ANSWERS_GENERATION_CONFIG = _PLAN_GENERATION_CONFIG
+
+# Questions answered per batched request; larger batches grow latency
+MAX_BATCH_SIZE = 5
+
+# Shorter plans are researched one request per question
+MIN_BATCH_SIZE = 3
+
+# Single-question requests in flight at once when a plan is not batched
+MAX_CONCURRENT_SEARCHES = 5
+
+# Prompt templates are built once; each call only fills in its topic or question.
+# The variable part always comes last so every request for the same template starts
+# with an identical prefix, which Gemini's implicit prefix caching can reuse.
+_PLANNER_PROMPT = """
+You are an expert research planner. Your task is to break down the topic below
+into 3-5 specific, answerable questions that would provide comprehensive coverage
+of the subject matter.
+
+Guidelines:
+- Each question should be specific and focused
+- Questions should cover different aspects of the topic
+- Questions should be researchable and answerable
+
+Return 3-5 research questions as a JSON array of strings.
+
+TOPIC: "{topic}"
+"""
+
+_SEARCH_PROMPT = """
+Provide a comprehensive and detailed answer to the question below.
+Use the most current and reliable information available.
+Include relevant facts, statistics, and context.
+
+Please provide a thorough response with:
+- Key facts and information
+- Relevant statistics or data points
+- Important context or background
+- Current developments or trends
+
+Question: {question}
+"""
+
+_SEARCH_FALLBACK_PROMPT = """
+Provide a comprehensive answer to the question below.
+
+Use your knowledge to provide detailed information including:
+- Key facts and concepts
+- Current trends and developments
+- Expert insights and analysis
+- Real-world examples
+- Statistical data where available
+
+Question: {question}
+"""
+
+# Batched counterparts of the two prompts above: the same instructions applied
+# to each of several numbered questions, answered as a JSON array of strings
+_BATCH_SEARCH_PROMPT = """
+Provide a comprehensive and detailed answer to each of the numbered questions below.
+Use the most current and reliable information available.
+Include relevant facts, statistics, and context.
+
+For every question please provide a thorough response with:
+- Key facts and information
+- Relevant statistics or data points
+- Important context or background
+- Current developments or trends
+
+Return ONLY a JSON array of strings, one answer per question,
+in the same order as the questions.
+
+{count} questions:
+{questions}
+"""
+
+_BATCH_FALLBACK_PROMPT = """
+Provide a comprehensive answer to each of the numbered questions below.
+
+For every question use your knowledge to provide detailed information including:
+- Key facts and concepts
+- Current trends and developments
+- Expert insights and analysis
+- Real-world examples
+- Statistical data where available
+
+Return a JSON array of strings, one answer per question,
+in the same order as the questions.
+
+{count} questions:
+{questions}
+"""
+
+# The synthesis prompt wraps the topic and the (large) research notes between a
+# fixed head and tail
+_SYNTH_HEAD = """
+You are an expert research analyst and technical writer. Your task is to synthesize
+the provided research notes into a comprehensive, well-structured report on the
+topic given below.
+
+Report Requirements:
+1. Create a professional, informative report
+2. Include an introduction that sets the context
+3. Organize findings into logical sections with clear headings
+4. Synthesize information from multiple sources into coherent insights
+5. Include a conclusion that summarizes key findings
+6. Use only the information provided in the research notes
+7. Write in a clear, professional tone
+8. Ensure the report flows logically from section to section
+"""
+
+_SYNTH_TOPIC = """
+TOPIC: "{topic}"
+
+## Research Notes ##
+"""
+
+_SYNTH_TAIL = """
+
+Please create a comprehensive report that effectively communicates the research findings.
+"""
+
+def _drive(steps, call):
+    """
+    Run a shared step generator synchronously: every request it yields is
+    answered with call(*request) and any exception is raised inside it
+    
+    Args:
+        steps: Generator holding the control flow shared with the async twin
+        call: Function that performs one yielded request
+        
+    Returns:
+        The generator's return value
+    """
+    try:
+        request = next(steps)
+        while True:
+            try:
+                response = call(*request)
+            except Exception as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+async def _drive_async(steps, call):
+    """
+    Async version of _drive: every yielded request is awaited with call(*request)
+    """
+    try:
+        request = next(steps)
+        while True:
+            try:
+                response = await call(*request)
+            except Exception as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+def _forward_chunk(chunk, on_chunk: Callable[[str], None]) -> str:
+    """
+    Pass the text of one streamed response chunk to on_chunk
+    
+    Returns:
+        str: The chunk's text ("" for chunks without text parts, e.g. the final metadata chunk)
+    """
+    try:
+        text = chunk.text
+    except ValueError:
+        return ""
+    if text:
+        on_chunk(text)
+    return text
+
 
 class PlannerAgent:
     """
@@ -13,10 +212,13 @@ class PlannerAgent:
     Acts as the project manager of the research process.
     """
     
-    def __init__(self, model):
+    def __init__(self, model, verbose: bool = True):
         self.model = model
         self.name = "Planner Agent"
+        # Background prefetches run quietly so they don't interleave with the prompt
+        self.verbose = verbose
     
+    @cached(namespace="planner")
     def create_research_plan(self, topic: str) -> List[str]:
         """
         Break down a topic into 3-5 specific, researchable questions
@@ -27,42 +229,66 @@ class PlannerAgent:
         Returns:
             List[str]: List of specific research questions
         """
-        print(f"{self.name}: Creating a research plan for '{topic}'...")
+        if self.verbose:
+            logger.debug("%s: Creating a research plan for '%s'...", self.name, topic)
         
-        prompt = f"""
-        You are an expert research planner. Your task is to break down the following topic
-        into 3-5 specific, answerable questions that would provide comprehensive coverage
-        of the subject matter.
-
-        TOPIC: "{topic}"
-
-        Guidelines:
-        - Each question should be specific and focused
-        - Questions should cover different aspects of the topic
-        - Questions should be researchable and answerable
-        - Return ONLY the questions as a Python list format
-
-        Example output format: ["question 1", "question 2", "question 3", "question 4"]
-        """
+        prompt = _PLANNER_PROMPT.format(topic=topic)
         
         try:
-            response = self.model.generate_content(prompt)
-            plan_str = response.text.strip()
-            
-            # Extract questions from the response
-            questions = self._extract_questions(plan_str)
+            response_text = cached_generate(self.model, prompt, generation_config=_PLAN_GENERATION_CONFIG)
+            return self._plan_from_response(response_text)
+                
+        except Exception as e:
+            if self.verbose:
+                logger.error("Error in %s: %s", self.name, e)
+            return []
+    
+    @cached(namespace="planner")
+    async def create_research_plan_async(self, topic: str) -> List[str]:
+        """
+        Async version of create_research_plan using generate_content_async
+        
+        Args:
+            topic (str): The main topic to research
             
-            if questions:
-                print(f"{self.name}: Research plan created with {len(questions)} questions:")
-                for i, question in enumerate(questions, 1):
-                    print(f"   {i}. {question}")
-                return questions
-            else:
-                print(f"{self.name}: Failed to extract questions from response")
-                return []
+        Returns:
+            List[str]: List of specific research questions
+        """
+        if self.verbose:
+            logger.debug("%s: Creating a research plan for '%s'...", self.name, topic)
+        
+        prompt = _PLANNER_PROMPT.format(topic=topic)
+        
+        try:
+            response_text = await cached_generate_async(self.model, prompt, generation_config=_PLAN_GENERATION_CONFIG)
+            return self._plan_from_response(response_text)
                 
         except Exception as e:
-            print(f"Error in {self.name}: {e}")
+            if self.verbose:
+                logger.error("Error in %s: %s", self.name, e)
+            return []
+    
+    def _plan_from_response(self, response_text: str) -> List[str]:
+        """
+        Extract the research plan from the model's response and report it
+        
+        Args:
+            response_text (str): Raw response from the model
+            
+        Returns:
+            List[str]: List of specific research questions (empty on failure)
+        """
+        questions = self._extract_questions(response_text.strip())
+        
+        if questions:
+            if self.verbose:
+                logger.info("%s: Research plan created with %s questions:", self.name, len(questions))
+                for i, question in enumerate(questions, 1):
+                    logger.info("   %s. %s", i, question)
+            return questions
+        else:
+            if self.verbose:
+                logger.warning("%s: Failed to extract questions from response", self.name)
             return []
     
     def _extract_questions(self, response_text: str) -> List[str]:
@@ -75,10 +301,29 @@ class PlannerAgent:
         Returns:
             List[str]: Cleaned list of questions
         """
-        # Try to find list format first
-        list_match = re.search(r'\[(.*?)\]', response_text, re.DOTALL)
-        if list_match:
-            list_content = list_match.group(1)
+        # Fast path: the plan is requested as structured JSON output, so it
+        # normally parses directly without touching the regexes below
+        text = response_text.strip()
+        if text.startswith('```'):
+            text = text.strip('`').strip()
+            if text.startswith('json'):
+                text = text[4:].lstrip()
+        
+        if text.startswith('['):
+            for parse in (json.loads, ast.literal_eval):
+                try:
+                    questions = parse(text)
+                except (ValueError, SyntaxError):
+                    continue
+                if isinstance(questions, list):
+                    questions = [q.strip() for q in questions if isinstance(q, str)]
+                    return [q for q in questions if len(q) > 10][:5]
+        
+        # Fallback for responses that ignored the JSON schema: find a list format
+        list_start = response_text.find('[')
+        list_end = response_text.find(']', list_start + 1) if list_start != -1 else -1
+        if list_end != -1:
+            list_content = response_text[list_start + 1:list_end]
             # Split by comma and clean up
             questions = [q.strip().strip('"\'') for q in list_content.split(',')]
             return [q for q in questions if q and len(q) > 10]  # Filter out empty/short items
@@ -88,12 +333,14 @@ class PlannerAgent:
         questions = []
         for line in lines:
             line = line.strip()
-            if (line.startswith(('1.', '2.', '3.', '4.', '5.')) or 
-                line.startswith(('-', '*')) or
-                ('?' in line and len(line) > 20)):
-                # Clean up the line
-                clean_line = re.sub(r'^\d+\.\s*', '', line)
-                clean_line = re.sub(r'^[-*]\s*', '', clean_line)
+            if line.startswith(_LINE_STARTS) or ('?' in line and len(line) > 20):
+                # Clean up the line: drop a "3." number, then a "-"/"*" bullet
+                clean_line = line
+                number, dot, rest = clean_line.partition('.')
+                if dot and number.isdecimal():
+                    clean_line = rest.lstrip()
+                if clean_line.startswith(_BULLETS):
+                    clean_line = clean_line[1:].lstrip()
                 clean_line = clean_line.strip('"\'')
                 if clean_line:
                     questions.append(clean_line)
@@ -101,19 +348,34 @@ class PlannerAgent:
         return questions[:5]  # Limit to 5 questions
 
 
-class SearchAgent:
+class BaseSearchAgent:
     """
-    The Search Agent uses Google Search to find detailed information for specific questions.
-    Acts as the diligent researcher gathering raw data.
+    Shared research logic for the search agents. Each call first tries
+    Google Search grounding and falls back to Gemini's own knowledge;
+    subclasses only choose their name, cache namespace and prompt templates.
     """
     
+    name = "Search Agent"
+    cache_namespace = "search"
+    # Prompt used with Google Search grounding (None skips the search step)
+    search_prompt = _SEARCH_PROMPT
+    # Prompt used to answer from Gemini's own knowledge
+    fallback_prompt = _SEARCH_FALLBACK_PROMPT
+    # Batched counterparts of the two prompts above ({count} numbered {questions})
+    batch_search_prompt = _BATCH_SEARCH_PROMPT
+    batch_fallback_prompt = _BATCH_FALLBACK_PROMPT
+    
     def __init__(self, model):
         self.model = model
-        self.name = "Search Agent"
+        # Shared Google Search tool, built once instead of per question
+        self._search_tool = genai.protos.Tool(
+            google_search_retrieval=genai.protos.GoogleSearchRetrieval()
+        )
     
+    @cached()
     def research_question(self, question: str) -> str:
         """
-        Research a specific question using Google Search
+        Research a specific question, using Google Search when available
         
         Args:
             question (str): The specific question to research
@@ -121,61 +383,238 @@ class SearchAgent:
         Returns:
             str: Detailed research findings
         """
-        print(f"{self.name}: Researching question: '{question}'...")
+        return _drive(self._research_steps(question), self._invoke)
+    
+    @cached()
+    async def research_question_async(self, question: str) -> str:
+        """
+        Async version of research_question using generate_content_async
         
-        try:
-            # Configure Google Search tool
-            search_tool = genai.protos.Tool(
-                google_search_retrieval=genai.protos.GoogleSearchRetrieval()
-            )
+        Args:
+            question (str): The specific question to research
             
-            prompt = f"""
-            Provide a comprehensive and detailed answer to the following question.
-            Use the most current and reliable information available.
-            Include relevant facts, statistics, and context.
+        Returns:
+            str: Detailed research findings
+        """
+        return await _drive_async(self._research_steps(question), self._invoke_async)
+    
+    @cached_many()
+    async def research_questions_batch_async(self, questions: List[str]) -> List[str]:
+        """
+        Research a whole research plan with as few requests as possible
+        
+        Plans shorter than MIN_BATCH_SIZE are researched one question at a time;
+        longer plans are sent in batches of at most MAX_BATCH_SIZE questions.
+        All batches (or single questions) are in flight at the same time.
+        
+        Args:
+            questions (List[str]): The questions from the research plan
             
-            Question: {question}
+        Returns:
+            List[str]: One answer per question in the same order ("" if none was found)
+        """
+        if len(questions) < MIN_BATCH_SIZE:
+            return await self._research_individually_async(questions)
+        
+        batch_answers = await asyncio.gather(
+            *(self._research_batch_async(batch) for batch in self._split_batches(questions))
+        )
+        return [answer for batch in batch_answers for answer in batch]
+    
+    async def research_questions_async(self, questions: List[str]) -> List[str]:
+        """
+        Research several questions with a single Gemini request
+        
+        Args:
+            questions (List[str]): The questions to research, at most MAX_BATCH_SIZE
             
-            Please provide a thorough response with:
-            - Key facts and information
-            - Relevant statistics or data points
-            - Important context or background
-            - Current developments or trends
-            """
+        Returns:
+            List[str]: One answer per question in the same order, or an empty
+            list if the batched response could not be used (the caller then
+            researches each question on its own)
+        """
+        logger.debug("%s: Researching %s questions in one request...", self.name, len(questions))
+        
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+        
+        # Method 1: Try with Google Search tool (JSON mode is not available with tools)
+        if self.batch_search_prompt:
+            try:
+                prompt = self.batch_search_prompt.format(count=len(questions), questions=numbered)
+                
+                answers = self._parse_answers(await self._invoke_async(prompt), len(questions))
+                
+                if answers:
+                    logger.debug("   ✓ %s answers found via Google Search", len(answers))
+                    return answers
+                # Search worked but the free-form answers could not be split up:
+                # keep the grounding and let the caller ask one question at a time
+                logger.warning("   ⚠️  Could not read batched Google Search answers")
+                return []
+                
+            except Exception as search_error:
+                logger.warning("   ⚠️  Google Search failed: %s", search_error)
+                logger.debug("   🔄 Trying alternative research method...")
+        
+        # Method 2: Fallback to Gemini's knowledge with structured JSON output
+        # (only when there is no search step or the search itself failed)
+        try:
+            fallback_prompt = self.batch_fallback_prompt.format(count=len(questions), questions=numbered)
             
-            response = self.model.generate_content(prompt, tools=[search_tool])
+            response_text = await self._invoke_async(
+                fallback_prompt, use_search=False, generation_config=_ANSWERS_GENERATION_CONFIG
+            )
+            return self._report_batch_fallback(self._parse_answers(response_text, len(questions)))
             
-            if response.text:
-                print(f"   ✓ Information found and processed")
-                return response.text
-            else:
-                print(f"   ✗ No information found")
-                return ""
+        except Exception as e:
+            logger.error("Error in %s: %s", self.name, e)
+            return []
+    
+    def _research_steps(self, question: str):
+        """
+        Control flow shared by research_question and research_question_async.
+        Yields _invoke arguments and receives each response text.
+        """
+        logger.debug("%s: Researching question: '%s'...", self.name, question)
+        
+        # Method 1: Try with Google Search tool
+        if self.search_prompt:
+            try:
+                research_data = yield self.search_prompt.format(question=question), True
+                
+                if research_data:
+                    logger.debug("   ✓ Information found via Google Search")
+                    return research_data
+                logger.warning("   ⚠️  Google Search returned no results, trying alternative method...")
                 
+            except Exception as search_error:
+                logger.warning("   ⚠️  Google Search failed: %s", search_error)
+                logger.debug("   🔄 Trying alternative research method...")
+        
+        # Method 2: Gemini's own knowledge
+        try:
+            research_data = yield self.fallback_prompt.format(question=question), False
+            return self._report_fallback(research_data)
+            
         except Exception as e:
-            print(f"Error in {self.name}: {e}")
-            # Fallback: Try without Google Search if search grounding fails
-            if "Search Grounding is not supported" in str(e):
-                print(f"   🔄 Trying fallback method (no Google Search)...")
-                try:
-                    fallback_prompt = f"""
-                    Provide a comprehensive answer to: {question}
-                    
-                    Use your knowledge to provide detailed information including:
-                    - Key facts and concepts
-                    - Current trends and developments
-                    - Expert insights and analysis
-                    - Real-world examples
-                    - Statistical data where available
-                    """
-                    
-                    fallback_response = self.model.generate_content(fallback_prompt)
-                    if fallback_response.text:
-                        print(f"   ✓ Information found via fallback method")
-                        return fallback_response.text
-                except Exception as fallback_error:
-                    print(f"   ✗ Fallback also failed: {fallback_error}")
+            logger.error("Error in %s: %s", self.name, e)
             return ""
+    
+    async def _research_batch_async(self, questions: List[str]) -> List[str]:
+        """
+        Research a batch of questions in one request, falling back to one
+        request per question if the batched answers cannot be used
+        """
+        answers = await self.research_questions_async(questions)
+        if answers:
+            return answers
+        
+        logger.debug("   🔄 Researching %s questions individually...", len(questions))
+        return await self._research_individually_async(questions)
+    
+    async def _research_individually_async(self, questions: List[str]) -> List[str]:
+        """
+        Research each question with its own request, at most
+        MAX_CONCURRENT_SEARCHES at a time
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        # Callers sit behind @cached_many, so skip research_question_async's own cache layer
+        research_question = type(self).research_question_async.__wrapped__
+        
+        async def research(question: str) -> str:
+            async with semaphore:
+                return await research_question(self, question)
+        
+        return list(await asyncio.gather(*(research(question) for question in questions)))
+    
+    def _split_batches(self, questions: List[str]) -> List[List[str]]:
+        return [
+            questions[start:start + MAX_BATCH_SIZE]
+            for start in range(0, len(questions), MAX_BATCH_SIZE)
+        ]
+    
+    def _parse_answers(self, response_text: str, expected: int) -> List[str]:
+        """
+        Parse a JSON array of answers, tolerating a surrounding markdown code fence
+        
+        Args:
+            response_text (str): Raw response from the model
+            expected (int): Number of answers the response must contain
+            
+        Returns:
+            List[str]: The answers, or an empty list if they cannot be used
+        """
+        text = (response_text or "").strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[text.find("["):]
+        
+        try:
+            answers = json.loads(text)
+        except ValueError:
+            return []
+        
+        if (not isinstance(answers, list) or len(answers) != expected or
+                not all(isinstance(a, str) and a.strip() for a in answers)):
+            return []
+        return answers
+    
+    def _invoke(self, prompt: str, use_search: bool = True, generation_config: Optional[dict] = None) -> str:
+        """
+        Send a prompt to Gemini through the shared rate limiter
+        
+        Args:
+            prompt (str): The prompt to send
+            use_search (bool): Ground the answer with the Google Search tool
+            generation_config (Optional[dict]): Extra generation settings (e.g. JSON mode)
+            
+        Returns:
+            str: The response text
+        """
+        return cached_generate(self.model, prompt, **self._request_kwargs(use_search, generation_config))
+    
+    async def _invoke_async(self, prompt: str, use_search: bool = True,
+                            generation_config: Optional[dict] = None) -> str:
+        """
+        Async version of _invoke using generate_content_async
+        """
+        return await cached_generate_async(self.model, prompt, **self._request_kwargs(use_search, generation_config))
+    
+    def _request_kwargs(self, use_search: bool, generation_config: Optional[dict]) -> dict:
+        kwargs = {}
+        if use_search:
+            kwargs["tools"] = [self._search_tool]
+        if generation_config is not None:
+            kwargs["generation_config"] = generation_config
+        return kwargs
+    
+    def _report_fallback(self, research_data: str) -> str:
+        if research_data:
+            logger.debug("   ✓ Information found via knowledge base")
+            return research_data
+        logger.warning("   ✗ No information found")
+        return ""
+    
+    def _report_batch_fallback(self, answers: List[str]) -> List[str]:
+        if answers:
+            logger.debug("   ✓ %s answers found via knowledge base", len(answers))
+            return answers
+        logger.warning("   ✗ Batched answers did not match the questions")
+        return []
+
+
+class SearchAgent(BaseSearchAgent):
+    """
+    The Search Agent uses Google Search to find detailed information for specific questions.
+    Acts as the diligent researcher gathering raw data.
+    """
+    
+    name = "Search Agent"
+    cache_namespace = "search"
+    search_prompt = _SEARCH_PROMPT
+    fallback_prompt = _SEARCH_FALLBACK_PROMPT
+    batch_search_prompt = _BATCH_SEARCH_PROMPT
+    batch_fallback_prompt = _BATCH_FALLBACK_PROMPT
 
 
 class SynthesizerAgent:
@@ -188,58 +627,123 @@ class SynthesizerAgent:
         self.model = model
         self.name = "Synthesizer Agent"
     
-    def create_final_report(self, topic: str, research_results: List[Tuple[str, str]]) -> str:
+    def create_final_report(self, topic: str, research_results: List[Tuple[str, str]],
+                            on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Synthesize all research findings into a comprehensive report
         
         Args:
             topic (str): The main research topic
             research_results (List[Tuple[str, str]]): List of (question, research_data) tuples
+            on_chunk (Optional[Callable[[str], None]]): If given, the report is streamed
+                and each piece of text is passed to this callback as soon as it arrives
             
         Returns:
             str: Final synthesized report
         """
-        print(f"{self.name}: Writing the final report...")
+        if on_chunk is not None:
+            generate = functools.partial(self._stream_report, on_chunk=on_chunk)
+        else:
+            generate = functools.partial(cached_generate, self.model)
+        return _drive(self._report_steps(topic, research_results), generate)
+    
+    async def create_final_report_async(self, topic: str, research_results: List[Tuple[str, str]],
+                                        on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Async version of create_final_report using generate_content_async
+        
+        Args:
+            topic (str): The main research topic
+            research_results (List[Tuple[str, str]]): List of (question, research_data) tuples
+            on_chunk (Optional[Callable[[str], None]]): If given, the report is streamed
+                and each piece of text is passed to this callback as soon as it arrives
+            
+        Returns:
+            str: Final synthesized report
+        """
+        if on_chunk is not None:
+            generate = functools.partial(self._stream_report_async, on_chunk=on_chunk)
+        else:
+            generate = functools.partial(cached_generate_async, self.model)
+        return await _drive_async(self._report_steps(topic, research_results), generate)
+    
+    def _report_steps(self, topic: str, research_results: List[Tuple[str, str]]):
+        """
+        Control flow shared by create_final_report and create_final_report_async.
+        Yields the synthesis prompt once and receives the generated report.
+        """
+        logger.debug("%s: Writing the final report...", self.name)
         
         if not research_results:
             return "Error: No research data available to synthesize."
         
-        # Compile all research notes
-        research_notes = self._compile_research_notes(research_results)
-        
-        prompt = f"""
-        You are an expert research analyst and technical writer. Your task is to synthesize
-        the provided research notes into a comprehensive, well-structured report on the topic: "{topic}".
-
-        Report Requirements:
-        1. Create a professional, informative report
-        2. Include an introduction that sets the context
-        3. Organize findings into logical sections with clear headings
-        4. Synthesize information from multiple sources into coherent insights
-        5. Include a conclusion that summarizes key findings
-        6. Use only the information provided in the research notes
-        7. Write in a clear, professional tone
-        8. Ensure the report flows logically from section to section
-
-        ## Research Notes ##
-        {research_notes}
-        
-        Please create a comprehensive report that effectively communicates the research findings.
-        """
+        prompt = self._build_prompt(topic, research_results)
         
         try:
-            response = self.model.generate_content(prompt)
+            report = yield (prompt,)
             
-            if response.text:
-                print(f"   ✓ Final report generated successfully")
-                return response.text
+            if report:
+                logger.debug("   ✓ Final report generated successfully")
+                return report
             else:
                 return "Error: Could not generate the final report."
                 
         except Exception as e:
-            print(f"Error in {self.name}: {e}")
+            logger.error("Error in %s: %s", self.name, e)
             return "Error: Could not generate the final report."
     
+    def _build_prompt(self, topic: str, research_results: List[Tuple[str, str]]) -> str:
+        # Compile all research notes
+        research_notes = self._compile_research_notes(research_results)
+        
+        return _SYNTH_HEAD + _SYNTH_TOPIC.format(topic=topic) + research_notes + _SYNTH_TAIL
+    
+    def _stream_report(self, prompt: str, on_chunk: Callable[[str], None]) -> str:
+        """
+        Generate the report as a stream, forwarding each text chunk as it arrives
+        
+        Args:
+            prompt (str): The complete synthesis prompt
+            on_chunk (Callable[[str], None]): Receives each piece of report text
+            
+        Returns:
+            str: The full report text ("" if nothing was generated)
+        """
+        # A cached report is shown in one piece
+        report = lookup_response(self.model, prompt)
+        if report:
+            on_chunk(report)
+            return report
+        
+        stream = call_with_backoff(self.model.generate_content, prompt, stream=True)
+        report = "".join([_forward_chunk(chunk, on_chunk) for chunk in stream])
+        if report:
+            store_response(self.model, prompt, report)
+        return report
+    
+    async def _stream_report_async(self, prompt: str, on_chunk: Callable[[str], None]) -> str:
+        """
+        Async version of _stream_report
+        
+        Args:
+            prompt (str): The complete synthesis prompt
+            on_chunk (Callable[[str], None]): Receives each piece of report text
+            
+        Returns:
+            str: The full report text ("" if nothing was generated)
+        """
+        # A cached report is shown in one piece
+        report = await asyncio.to_thread(lookup_response, self.model, prompt)
+        if report:
+            on_chunk(report)
+            return report
+        
+        stream = await call_with_backoff_async(self.model.generate_content_async, prompt, stream=True)
+        report = "".join([_forward_chunk(chunk, on_chunk) async for chunk in stream])
+        if report:
+            await asyncio.to_thread(store_response, self.model, prompt, report)
+        return report
+    
     def _compile_research_notes(self, research_results: List[Tuple[str, str]]) -> str:
         """
         Compile research results into formatted notes
@@ -250,16 +754,34 @@ class SynthesizerAgent:
         Returns:
             str: Formatted research notes
         """
-        research_notes = ""
+        parts = []
+        append = parts.append
         
         for i, (question, data) in enumerate(research_results, 1):
-            research_notes += f"""
+            append(f"""
 ### Research Question {i}: {question}
 
 **Research Findings:**
 {data}
 
 ---
-"""
+""")
         
-        return research_notes
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def get_agents(model, searcher_cls=SearchAgent) -> Tuple[PlannerAgent, BaseSearchAgent, SynthesizerAgent]:
+    """
+    Create the planner, search and synthesizer agents for a model. The agents
+    keep no per-topic state, so each combination is built once per process and
+    shared by every assistant and research run.
+    
+    Args:
+        model: The configured Gemini model (see config.configure_gemini)
+        searcher_cls: The search agent class to use (e.g. SearchAgent)
+        
+    Returns:
+        Tuple[PlannerAgent, BaseSearchAgent, SynthesizerAgent]: The three agents
+    """
+    return PlannerAgent(model), searcher_cls(model), SynthesizerAgent(model)
@@ -0,0 +1,197 @@
+"""
+Research assistant shared by every entry point
+Coordinates the Planner, Search and Synthesizer agents around one search agent class
+"""
+
+import asyncio
+import logging
+from typing import Dict, List
+from config import configure_gemini, run_async, validate_api_key_live, validate_api_key_shape
+from agents import SearchAgent, get_agents
+from cache import normalize_text
+from cli import display_report, print_report_footer, print_report_header
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchAssistant:
+    """
+    Orchestrator that coordinates the three agents:
+    - Planner Agent: Breaks down topics into research questions
+    - Search Agent: Researches each question (the class is chosen per variant)
+    - Synthesizer Agent: Creates the final comprehensive report
+    """
+    
+    def __init__(self, searcher_cls=SearchAgent, name: str = "Multi-Agent Research Assistant",
+                 ready_message: str = "System ready for research!"):
+        """
+        Args:
+            searcher_cls: The search agent class used for Step 2 (e.g. SearchAgent)
+            name (str): Name shown while the system initializes
+            ready_message (str): Message shown once initialization succeeded
+        """
+        self.searcher_cls = searcher_cls
+        self.name = name
+        self.ready_message = ready_message
+        self.model = None
+        self.planner = None
+        self.searcher = None
+        self.synthesizer = None
+        # Answers found during this session, by normalized question
+        self._session_cache: Dict[str, str] = {}
+        
+    def initialize(self, validate_live: bool = False):
+        """
+        Initialize the system by configuring the Gemini model and creating agent instances
+        
+        The API key is only checked for a plausible format unless validate_live is
+        True, in which case a real API request confirms that the key works.
+        
+        Args:
+            validate_live (bool): Confirm the API key with a real API request
+            
+        Returns:
+            bool: True if initialization successful, False otherwise
+        """
+        try:
+            logger.info("🚀 Initializing %s...", self.name)
+            
+            # Configure Gemini model
+            self.model = configure_gemini()
+            logger.info("   ✓ Gemini model configured")
+            
+            # Validate API key (format only, unless a live check was requested)
+            valid = validate_api_key_live() if validate_live else validate_api_key_shape()
+            if not valid:
+                logger.error("   ✗ API key validation failed")
+                return False
+            logger.info("   ✓ API key validated")
+            
+            # Initialize agents
+            self.planner, self.searcher, self.synthesizer = get_agents(self.model, self.searcher_cls)
+            logger.info("   ✓ All agents initialized")
+            
+            logger.info("🎉 %s", self.ready_message)
+            return True
+            
+        except Exception as e:
+            logger.error("❌ Initialization failed: %s", e)
+            return False
+    
+    def conduct_research(self, topic: str, stream: bool = False) -> str:
+        """
+        Conduct comprehensive research on a given topic using all three agents
+        
+        Args:
+            topic (str): The topic to research
+            stream (bool): Print the final report to the terminal as it is
+                written, so the caller does not need to call display_report()
+            
+        Returns:
+            str: Final research report
+        """
+        return run_async(self.conduct_research_async(topic, stream))
+    
+    def research_topics(self, topics: List[str]) -> List[str]:
+        """
+        Research several independent topics concurrently
+        
+        Returns:
+            List[str]: One final report per topic, in the same order
+        """
+        return run_async(self.research_topics_async(topics))
+    
+    async def research_topics_async(self, topics: List[str]) -> List[str]:
+        """
+        Async version of research_topics: all topics share one event loop, so
+        their Gemini calls are in flight at the same time
+        """
+        return list(await asyncio.gather(*(self.conduct_research_async(topic) for topic in topics)))
+    
+    async def conduct_research_async(self, topic: str, stream: bool = False) -> str:
+        """
+        Async version of conduct_research
+        """
+        if not self.model:
+            return "Error: System not initialized. Please run initialize() first."
+        
+        logger.info("\n🔍 Starting research process for: '%s'", topic)
+        logger.info("=" * 60)
+        
+        # Step 1: Create research plan
+        logger.info("\n📋 STEP 1: Creating Research Plan")
+        logger.info("-" * 40)
+        research_plan = await self.planner.create_research_plan_async(topic)
+        
+        if not research_plan:
+            return "❌ Could not create a research plan. Please try a different topic."
+        
+        # Step 2: Research the questions in batches, all batches at once
+        logger.info("\n🔎 STEP 2: Conducting Research (%s questions)", len(research_plan))
+        logger.info("-" * 40)
+        keys = [normalize_text(question) for question in research_plan]
+        
+        # Only questions not yet answered this session (or repeated in the plan) are researched
+        new_questions = {}
+        for key, question in zip(keys, research_plan):
+            if key not in self._session_cache:
+                new_questions.setdefault(key, question)
+        
+        if new_questions:
+            answers = await self.searcher.research_questions_batch_async(list(new_questions.values()))
+            for key, research_data in zip(new_questions, answers):
+                if research_data:
+                    self._session_cache[key] = research_data
+        
+        # Keep the results in plan order for the synthesizer, each question once
+        research_results = []
+        seen = set()
+        
+        for i, (key, question) in enumerate(zip(keys, research_plan), 1):
+            research_data = self._session_cache.get(key)
+            if not research_data:
+                logger.warning("   ⚠️  Question %s - no data found", i)
+                continue
+            logger.info("   ✓ Question %s completed", i)
+            if key not in seen:
+                seen.add(key)
+                research_results.append((question, research_data))
+        
+        if not research_results:
+            return "❌ Could not find any information during research. Please try a different topic."
+        
+        # Step 3: Synthesize final report
+        logger.info("\n📝 STEP 3: Creating Final Report")
+        logger.info("-" * 40)
+        if not stream:
+            return await self.synthesizer.create_final_report_async(topic, research_results)
+        
+        # Show the report token by token instead of waiting for all of it
+        streamed = []
+        
+        def show_chunk(text: str):
+            if not streamed:
+                print_report_header(topic)
+            streamed.append(text)
+            print(text, end="", flush=True)
+        
+        final_report = await self.synthesizer.create_final_report_async(
+            topic, research_results, on_chunk=show_chunk
+        )
+        if streamed:
+            print()
+            print_report_footer()
+        else:
+            display_report(topic, final_report)
+        
+        return final_report
+    
+    def display_report(self, topic: str, report: str):
+        """
+        Display the final research report in a formatted way
+        
+        Args:
+            topic (str): The research topic
+            report (str): The final report
+        """
+        display_report(topic, report)
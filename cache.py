@@ -0,0 +1,569 @@
+"""
+Response cache for the Multi-Agent System
+Stores agent results and raw Gemini responses on disk so repeated topics,
+questions and prompts skip the Gemini API
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import math
+import os
+import sqlite3
+import string
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import google.generativeai as genai
+
+from limits import call_with_backoff, call_with_backoff_async
+
+logger = logging.getLogger(__name__)
+
+# Embedding model used for the semantic lookup tier
+EMBEDDING_MODEL = "models/text-embedding-004"
+
+# Default on-disk location of the cache database
+DEFAULT_CACHE_PATH = os.path.join(".llm_cache", "cache.sqlite3")
+
+# Namespace of raw Gemini responses, keyed by model, settings and full prompt
+GENERATE_NAMESPACE = "generate"
+
+# Raw responses kept in memory in front of the on-disk tier
+MEMORY_CACHE_SIZE = 1024
+
+# Seconds the semantic tier is skipped after an embedding request failed
+EMBEDDING_RETRY_DELAY = 300
+
+# Punctuation removed from agent inputs before they are embedded
+_PUNCTUATION_TRANS = str.maketrans('', '', string.punctuation)
+
+@functools.lru_cache(maxsize=1)
+def _threshold_from_env(default: float = 0.92) -> float:
+    """
+    Semantic threshold of the search namespaces from LLMCACHE_SEMANTIC_THRESHOLD,
+    or the default if it is unset or not a number between 0 and 1. Read on the
+    first lookup, once config has loaded .env.
+    """
+    value = os.getenv("LLMCACHE_SEMANTIC_THRESHOLD")
+    if not value:
+        return default
+    try:
+        threshold = float(value)
+    except ValueError:
+        threshold = -1
+    if 0 <= threshold <= 1:
+        return threshold
+    logger.warning("⚠️  Ignoring invalid LLMCACHE_SEMANTIC_THRESHOLD=%r, using %s", value, default)
+    return default
+
+
+# Minimum cosine similarity for a semantic hit; lower values reuse answers more eagerly
+DEFAULT_SEMANTIC_THRESHOLD = 0.95
+
+# Namespaces whose semantic tier uses a threshold other than DEFAULT_SEMANTIC_THRESHOLD.
+# Research questions are reused more eagerly than plans (0.92 unless
+# LLMCACHE_SEMANTIC_THRESHOLD says otherwise)
+_NAMESPACE_THRESHOLDS = {
+    "search": _threshold_from_env,
+    "google_search": _threshold_from_env,
+}
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize an agent input for exact cache lookups: lowercase with single
+    spaces. Punctuation is kept because it can change the meaning
+    ("C++" vs "C", "3.5%" vs "35%").
+    """
+    return " ".join(text.lower().split())
+
+
+def _embedding_text(text: str) -> str:
+    """
+    Text sent to the embedding model for the semantic tier: the normalized
+    input without punctuation, which only matters for exact matches
+    """
+    return " ".join(normalize_text(text).translate(_PUNCTUATION_TRANS).split())
+
+
+def _report_hit(agent, text: str):
+    if getattr(agent, "verbose", True):
+        logger.debug("%s: Using cached result for '%s'", agent.name, text)
+
+
+def cached_many(namespace: Optional[str] = None):
+    """
+    Cache an async agent method that maps a list of texts to one result per text.
+    Texts with a cached result (exact or semantic match) are answered from the
+    cache and only the rest are passed to the method, so a batch never pays
+    again for questions that were already researched.
+
+    Args:
+        namespace (Optional[str]): Name of the agent operation (e.g. "search");
+            defaults to the agent's cache_namespace attribute
+    """
+    def misses(agent, texts: List[str], found) -> List[int]:
+        missing = []
+        for i, (text, (value, _)) in enumerate(zip(texts, found)):
+            if value is None:
+                missing.append(i)
+            else:
+                _report_hit(agent, text)
+        return missing
+
+    def store_many(key_space: str, keys: List[str], found, missing: List[int], results):
+        for i, result in zip(missing, results):
+            if result:
+                response_cache.store(key_space, keys[i], json.dumps(result), found[i][1])
+
+    def merge(found, missing: List[int], results) -> list:
+        merged = [json.loads(value) if value is not None else None for value, _ in found]
+        for i, result in zip(missing, results):
+            merged[i] = result
+        return merged
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, texts: List[str]):
+            key_space = namespace or self.cache_namespace
+            keys = [normalize_text(text) for text in texts]
+            found = await asyncio.to_thread(response_cache.lookup_many, key_space, keys)
+            missing = misses(self, texts, found)
+            results = []
+            if missing:
+                results = await method(self, [texts[i] for i in missing])
+                await asyncio.to_thread(store_many, key_space, keys, found, missing, results)
+            return merge(found, missing, results)
+        return wrapper
+    return decorator
+
+
+class _LRUCache:
+    """
+    Small thread-safe least-recently-used map
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class LLMCache:
+    """
+    Two-tier cache for agent results:
+    - Exact tier: SHA-256 of the agent namespace and input text
+    - Semantic tier: nearest cached input by embedding cosine similarity,
+      searched in an in-memory index that is loaded once per namespace
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = 7 * 24 * 3600,
+                 semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+                 namespace_thresholds: Optional[Dict[str, Union[float, Callable[[], float]]]] = None):
+        self.path = path
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+        # namespace -> threshold overriding semantic_threshold, or a function
+        # returning it that is called on each lookup in that namespace
+        self.namespace_thresholds = dict(namespace_thresholds or {})
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+        self._conn = None
+        self._lock = threading.Lock()
+        # namespace -> {key: (unit embedding, value, created_at)}
+        self._index: Dict[str, Dict[str, Tuple[List[float], str, float]]] = {}
+        # Recent embeddings, so a text looked up and then stored is embedded once
+        self._embeddings = _LRUCache(MEMORY_CACHE_SIZE)
+        # time.monotonic() of the last failed embedding request
+        self._embedding_failed_at: Optional[float] = None
+
+    def lookup(self, namespace: str, text: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Look up a cached value, first by exact key and then by meaning
+
+        Args:
+            namespace (str): Name of the agent operation (e.g. "planner")
+            text (str): The input text (topic or question)
+
+        Returns:
+            Tuple[Optional[str], Optional[List[float]]]: The cached value (or None)
+            and the embedding of the text, so a following store() can reuse it
+        """
+        return self.lookup_many(namespace, [text])[0]
+
+    def lookup_many(self, namespace: str, texts: List[str]) -> List[Tuple[Optional[str], Optional[List[float]]]]:
+        """
+        Look up several texts at once; the exact misses are embedded in one request
+
+        Args:
+            namespace (str): Name of the agent operation (e.g. "search")
+            texts (List[str]): The input texts
+
+        Returns:
+            List[Tuple[Optional[str], Optional[List[float]]]]: One (value, embedding)
+            pair per text, as returned by lookup()
+        """
+        oldest = time.time() - self.ttl
+        results = []
+
+        with self._lock:
+            for text in texts:
+                value = self._fetch_exact(namespace, text, oldest)
+                if value is not None:
+                    self.stats["hits"] += 1
+                results.append((value, None))
+
+        missing = [i for i, (value, _) in enumerate(results) if value is None]
+        if not missing:
+            return results
+
+        embeddings = self._embed_many([texts[i] for i in missing])
+        with self._lock:
+            index = self._load_index(namespace, oldest)
+            threshold = self.namespace_thresholds.get(namespace, self.semantic_threshold)
+            if callable(threshold):
+                threshold = threshold()
+            for i, embedding in zip(missing, embeddings):
+                value = self._nearest(index, embedding, oldest, threshold) if embedding else None
+                self.stats["semantic_hits" if value is not None else "misses"] += 1
+                results[i] = (value, embedding)
+        return results
+
+    def get(self, namespace: str, text: str) -> Optional[str]:
+        """
+        Look up a cached value by exact key only (no embedding request)
+
+        Args:
+            namespace (str): Name of the cached operation (e.g. "generate")
+            text (str): The exact input text
+
+        Returns:
+            Optional[str]: The cached value, or None on a miss
+        """
+        with self._lock:
+            value = self._fetch_exact(namespace, text, time.time() - self.ttl)
+            self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def put(self, namespace: str, text: str, value: str):
+        """
+        Store a value that is only ever looked up by exact key
+
+        Args:
+            namespace (str): Name of the cached operation (e.g. "generate")
+            text (str): The exact input text
+            value (str): The value to cache
+        """
+        self._insert(namespace, text, value, None)
+
+    def store(self, namespace: str, text: str, value: str, embedding: Optional[List[float]] = None):
+        """
+        Store a value for the given input text
+
+        Args:
+            namespace (str): Name of the agent operation (e.g. "planner")
+            text (str): The input text (topic or question)
+            value (str): The serialized result to cache
+            embedding (Optional[List[float]]): Precomputed embedding of the text
+        """
+        if embedding is None:
+            embedding = self._embed_many([text])[0]
+        self._insert(namespace, text, value, embedding)
+
+    def _nearest(self, index: Dict[str, Tuple[List[float], str, float]], embedding: List[float],
+                 oldest: float, threshold: float) -> Optional[str]:
+        """
+        Value of the most similar unexpired entry above the threshold, or None
+        """
+        best_value, best_score = None, threshold
+        for stored, value, created_at in index.values():
+            if created_at < oldest:
+                continue
+            score = sum(a * b for a, b in zip(embedding, stored))
+            if score >= best_score:
+                best_value, best_score = value, score
+        return best_value
+
+    def _load_index(self, namespace: str, oldest: float) -> Dict[str, Tuple[List[float], str, float]]:
+        # Caller must hold self._lock
+        if namespace not in self._index:
+            rows = self._connect().execute(
+                "SELECT key, embedding, value, created_at FROM responses "
+                "WHERE namespace = ? AND embedding IS NOT NULL AND created_at >= ?",
+                (namespace, oldest),
+            ).fetchall()
+            self._index[namespace] = {key: (json.loads(stored), value, created_at)
+                                      for key, stored, value, created_at in rows}
+        return self._index[namespace]
+
+    def _fetch_exact(self, namespace: str, text: str, oldest: float) -> Optional[str]:
+        # Caller must hold self._lock
+        row = self._connect().execute(
+            "SELECT value FROM responses WHERE key = ? AND created_at >= ?",
+            (self._key(namespace, text), oldest),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, namespace: str, text: str, value: str, embedding: Optional[List[float]]):
+        created_at = time.time()
+        key = self._key(namespace, text)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, text, value,
+                 json.dumps(embedding) if embedding else None, created_at),
+            )
+            conn.commit()
+            if embedding and namespace in self._index:
+                # Keyed like the table, so storing the same text again replaces its entry
+                self._index[namespace][key] = (embedding, value, created_at)
+
+    def _key(self, namespace: str, text: str) -> str:
+        payload = json.dumps({"agent": namespace, "prompt": text}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _embed_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed texts as unit vectors in one request; an entry is None if
+        embeddings are unavailable. After a failed request no new one is sent
+        for EMBEDDING_RETRY_DELAY seconds, so lookups fall back to the exact
+        tier without paying for another failing round-trip.
+        """
+        vectors = [self._embeddings.get(text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if not missing:
+            return vectors
+
+        failed_at = self._embedding_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < EMBEDDING_RETRY_DELAY:
+            return vectors
+
+        try:
+            result = call_with_backoff(
+                genai.embed_content,
+                model=EMBEDDING_MODEL, content=[_embedding_text(texts[i]) for i in missing],
+            )
+            embedded = result["embedding"]
+        except Exception as e:
+            self._embedding_failed_at = time.monotonic()
+            logger.warning("⚠️  Semantic cache unavailable for %ss: %s", EMBEDDING_RETRY_DELAY, e)
+            return vectors
+        self._embedding_failed_at = None
+
+        for i, vector in zip(missing, embedded):
+            norm = math.sqrt(sum(x * x for x in vector))
+            if norm:
+                vectors[i] = [x / norm for x in vector]
+                self._embeddings.put(texts[i], vectors[i])
+        return vectors
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, namespace TEXT, prompt TEXT, value TEXT, "
+                "embedding TEXT, created_at REAL)"
+            )
+            # Expired rows are never read again; drop them so the file stays bounded
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+        return self._conn
+
+
+# Shared cache instance used by all agents
+response_cache = LLMCache(namespace_thresholds=_NAMESPACE_THRESHOLDS)
+
+
+def cached(namespace: Optional[str] = None):
+    """
+    Cache an agent method whose result depends only on its text argument.
+    The text is looked up in normalized form (see normalize_text).
+    Empty results are never cached so failures are retried on the next call.
+    Works for both regular and async methods; the async wrapper does the
+    cache I/O in a worker thread so the event loop is never blocked.
+
+    Args:
+        namespace (Optional[str]): Name of the agent operation (e.g. "planner");
+            defaults to the agent's cache_namespace attribute
+    """
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, text: str):
+                key_space = namespace or self.cache_namespace
+                key = normalize_text(text)
+                value, embedding = await asyncio.to_thread(response_cache.lookup, key_space, key)
+                if value is not None:
+                    _report_hit(self, text)
+                    return json.loads(value)
+
+                result = await method(self, text)
+                if result:
+                    await asyncio.to_thread(
+                        response_cache.store, key_space, key, json.dumps(result), embedding
+                    )
+                return result
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, text: str):
+            key_space = namespace or self.cache_namespace
+            key = normalize_text(text)
+            value, embedding = response_cache.lookup(key_space, key)
+            if value is not None:
+                _report_hit(self, text)
+                return json.loads(value)
+
+            result = method(self, text)
+            if result:
+                response_cache.store(key_space, key, json.dumps(result), embedding)
+            return result
+        return wrapper
+    return decorator
+
+
+# In-memory tier in front of response_cache for raw Gemini responses
+_memory_cache = _LRUCache(MEMORY_CACHE_SIZE)
+
+# Gemini requests in flight, by response key, so identical concurrent requests share one call
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _response_key(model, prompt: str, kwargs: dict) -> str:
+    """
+    Cache key text for a Gemini request: model name, request settings and full prompt
+    """
+    settings = json.dumps(kwargs, sort_keys=True, default=repr)
+    return f"{model.model_name}|{settings}|{prompt}"
+
+
+def lookup_response(model, prompt: str, **kwargs) -> Optional[str]:
+    """
+    Look up the cached text of an earlier identical Gemini request
+
+    Args:
+        model: The Gemini model the request is sent to
+        prompt (str): The full prompt
+        **kwargs: generate_content arguments that affect the response
+
+    Returns:
+        Optional[str]: The cached response text, or None on a miss
+    """
+    key = _response_key(model, prompt, kwargs)
+    text = _memory_cache.get(key)
+    if text is None:
+        text = response_cache.get(GENERATE_NAMESPACE, key)
+        if text is not None:
+            _memory_cache.put(key, text)
+    return text
+
+
+def store_response(model, prompt: str, text: str, **kwargs):
+    """
+    Cache the response text of a Gemini request; empty responses are skipped
+
+    Args:
+        model: The Gemini model the request was sent to
+        prompt (str): The full prompt
+        text (str): The response text
+        **kwargs: generate_content arguments that affect the response
+    """
+    if not text:
+        return
+    key = _response_key(model, prompt, kwargs)
+    _memory_cache.put(key, text)
+    response_cache.put(GENERATE_NAMESPACE, key, text)
+
+
+def cached_generate(model, prompt: str, **kwargs) -> str:
+    """
+    generate_content through the response cache and the shared rate limiter
+
+    Args:
+        model: The Gemini model to call
+        prompt (str): The full prompt
+        **kwargs: Extra generate_content arguments (e.g. generation_config, tools)
+
+    Returns:
+        str: The response text
+    """
+    text = lookup_response(model, prompt, **kwargs)
+    if text is None:
+        text = call_with_backoff(model.generate_content, prompt, **kwargs).text
+        store_response(model, prompt, text, **kwargs)
+    return text
+
+
+class _OwnerCancelled(Exception):
+    """
+    Set on a shared in-flight request when the task that sent it was cancelled,
+    so the tasks waiting for it retry instead of being cancelled too
+    """
+
+
+async def cached_generate_async(model, prompt: str, **kwargs) -> str:
+    """
+    Async version of cached_generate using generate_content_async. Disk lookups
+    run in a worker thread so the event loop is never blocked, and a request
+    identical to one already in flight waits for that call instead of sending
+    its own.
+    """
+    key = _response_key(model, prompt, kwargs)
+    while True:
+        text = await asyncio.to_thread(lookup_response, model, prompt, **kwargs)
+        if text is not None:
+            return text
+
+        # No lock needed: nothing is awaited between this check and the insert below
+        pending = _inflight.get(key)
+        if pending is None:
+            break
+        try:
+            # Shielded so a cancelled waiter does not cancel the shared call
+            return await asyncio.shield(pending)
+        except _OwnerCancelled:
+            # Only the sender was cancelled: look up again and send it ourselves
+            continue
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        response = await call_with_backoff_async(model.generate_content_async, prompt, **kwargs)
+        text = response.text
+        await asyncio.to_thread(store_response, model, prompt, text, **kwargs)
+        future.set_result(text)
+        return text
+    except asyncio.CancelledError:
+        future.set_exception(_OwnerCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case nobody else was waiting
+        future.exception()
+        raise
+    finally:
+        del _inflight[key]
@@ -0,0 +1,99 @@
+"""
+Command-line interface shared by the research assistant entry points
+Runs the interactive research loop and displays the final reports
+"""
+
+import sys
+from config import configure_logging
+from util import save_report_to_file
+
+
+def run_cli(assistant, title: str, subtitle: str, report_prefix: str = "research_report",
+            report_title: str = "Research Report"):
+    """
+    Run the interactive research loop until the user quits
+    
+    Args:
+        assistant: The research assistant to use (see assistant.ResearchAssistant)
+        title (str): First line of the startup banner
+        subtitle (str): Second line of the startup banner
+        report_prefix (str): Start of the file name of saved reports
+        report_title (str): Heading written above saved reports
+    """
+    configure_logging(verbose="--verbose" in sys.argv)
+    
+    print(title)
+    print(subtitle)
+    print("=" * 50)
+    
+    # Initialize the system
+    if not assistant.initialize(validate_live="--validate" in sys.argv):
+        print("\n❌ Failed to initialize the system. Please check your API key and try again.")
+        print("\n💡 Setup Instructions:")
+        print("1. Get your Gemini API key from: https://makersuite.google.com/app/apikey")
+        print("2. Create a .env file in this directory")
+        print("3. Add your API key: GOOGLE_API_KEY=your_key_here")
+        return
+    
+    # Main interaction loop
+    while True:
+        print("\n" + "=" * 50)
+        print("🎯 What would you like to research today?")
+        print("(Type 'quit' or 'exit' to stop)")
+        
+        topic = input("\n📝 Enter your research topic: ").strip()
+        
+        if topic.lower() in ['quit', 'exit', 'q']:
+            print("\n👋 Thank you for using the Multi-Agent Research Assistant!")
+            break
+        
+        if not topic:
+            print("⚠️  Please enter a valid topic to research.")
+            continue
+        
+        try:
+            # Conduct research, streaming the report as it is written
+            report = assistant.conduct_research(topic, stream=True)
+            
+            # Display results
+            if report.startswith("❌"):
+                print(f"\n{report}")
+            else:
+                # Ask if user wants to save the report
+                save_choice = input("\n💾 Would you like to save this report to a file? (y/n): ").strip().lower()
+                if save_choice in ['y', 'yes']:
+                    save_report_to_file(topic, report, prefix=report_prefix, title=report_title)
+        
+        except KeyboardInterrupt:
+            print("\n\n⏹️  Research interrupted by user.")
+            break
+        except Exception as e:
+            print(f"\n❌ An error occurred during research: {e}")
+            print("Please try again with a different topic.")
+
+
+def display_report(topic: str, report: str):
+    """
+    Display the final research report in a formatted way
+    
+    Args:
+        topic (str): The research topic
+        report (str): The final report
+    """
+    print_report_header(topic)
+    print(report)
+    print_report_footer()
+
+
+def print_report_header(topic: str):
+    print("\n" + "=" * 80)
+    print("📊 FINAL RESEARCH REPORT")
+    print("=" * 80)
+    print(f"🎯 Topic: {topic}")
+    print("=" * 80)
+
+
+def print_report_footer():
+    print("=" * 80)
+    print("📋 End of Report")
+    print("=" * 80)
@@ -3,16 +3,41 @@ Configuration module for the Multi-Agent System
 Handles API key management and model configuration
 """
 
+import asyncio
+import functools
+import logging
 import os
+import re
+import sys
 from dotenv import load_dotenv
 import google.generativeai as genai
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Gemini model used by all agents
+MODEL_NAME = 'gemini-2.5-flash'
+
+# Set once the API key has been validated in this process
+_VALIDATED = False
+
+# Event loop shared by all async work in the process (see run_async)
+_EVENT_LOOP = None
+
+# Directory of the project modules; --verbose only shows debug messages logged
+# by modules loaded from here (library debug output stays hidden)
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Gemini API keys are long tokens of letters, digits, '_' and '-'
+_API_KEY_RE = re.compile(r'[A-Za-z0-9_-]{30,}')
+
+@functools.lru_cache(maxsize=1)
 def configure_gemini():
     """
-    Configure the Gemini API with the API key from environment variables
+    Configure the Gemini API with the API key from environment variables.
+    The model is created once per process and shared by all callers.
     
     Returns:
         genai.GenerativeModel: Configured Gemini model
@@ -29,25 +54,97 @@ def configure_gemini():
             "https://makersuite.google.com/app/apikey"
         )
     
-    # Configure the API
+    # Configure the API. The transport is left to the SDK: it picks gRPC for the
+    # sync client and grpc_asyncio for the async one, and a single override
+    # would be applied to both (breaking generate_content_async).
     genai.configure(api_key=api_key)
     
     # Return the model instance
     # Using gemini-2.5-flash for compatibility
-    return genai.GenerativeModel('gemini-2.5-flash')
+    return genai.GenerativeModel(MODEL_NAME)
+
+def run_async(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    The async Gemini client is bound to the event loop it was first used on,
+    so every call reuses one process-wide loop instead of asyncio.run().
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None:
+        _EVENT_LOOP = asyncio.new_event_loop()
+    return _EVENT_LOOP.run_until_complete(coro)
+
+def configure_logging(verbose: bool = False):
+    """
+    Send progress messages to the terminal. By default only the research steps,
+    the plan and problems are shown; verbose mode adds every agent action and
+    cache hit. The LOGLEVEL environment variable overrides the default level.
+    
+    Args:
+        verbose (bool): Show every agent action (the --verbose flag)
+    """
+    level_name = os.getenv("LOGLEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    valid_level = isinstance(level, int)
+    logging.basicConfig(level=level if valid_level else logging.INFO, format="%(message)s")
+    if not valid_level:
+        logger.warning("⚠️  Ignoring unknown LOGLEVEL=%r, using INFO", level_name)
+    if verbose:
+        for name in _project_modules():
+            logging.getLogger(name).setLevel(logging.DEBUG)
+
+def _project_modules():
+    """
+    Names of the loaded modules that belong to this project (including the
+    script being run as __main__), which are also the names of their loggers
+    """
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == _PROJECT_DIR:
+            yield name
+
+def validate_api_key_shape():
+    """
+    Check that the API key looks like a Gemini API key, without any network call
+    
+    Returns:
+        bool: True if the key has a plausible format, False otherwise
+    """
+    api_key = os.getenv("GOOGLE_API_KEY") or ""
+    if _API_KEY_RE.fullmatch(api_key):
+        return True
+    
+    logger.error("API key validation failed: GOOGLE_API_KEY does not look like a Gemini API key")
+    return False
 
-def validate_api_key():
+def validate_api_key_live():
     """
-    Validate that the API key is working by making a test call
+    Validate that the API key is working by looking up the model.
+    Only the first successful check in a process talks to the API.
     
     Returns:
         bool: True if API key is valid, False otherwise
     """
+    global _VALIDATED
+    if _VALIDATED:
+        return True
+    
     try:
-        model = configure_gemini()
-        # Make a simple test call
-        response = model.generate_content("Hello, this is a test.")
-        return response.text is not None
+        configure_gemini()
+        # Model metadata lookup authenticates without using generation quota
+        genai.get_model(f"models/{MODEL_NAME}")
+        _VALIDATED = True
+        return True
     except Exception as e:
-        print(f"API key validation failed: {e}")
+        logger.error("API key validation failed: %s", e)
         return False
+
+# Existing callers of validate_api_key get the live check
+validate_api_key = validate_api_key_live
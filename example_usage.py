@@ -3,8 +3,10 @@ Example usage and test cases for the Multi-Agent Research Assistant
 This file demonstrates how to use the system programmatically
 """
 
+import sys
 import time
-from config import configure_gemini, validate_api_key
+from concurrent.futures import ThreadPoolExecutor
+from config import configure_gemini, configure_logging, validate_api_key
 from agents import PlannerAgent, SearchAgent, SynthesizerAgent
 from main import MultiAgentResearchAssistant
 
@@ -86,6 +88,17 @@ def run_example_research():
         "Future of electric vehicles"
     ]
     
+    # Plan every example topic in the background while the user is choosing;
+    # finished plans land in the response cache and are reused by the research run.
+    # All three requests start at once, so the two plans that are not chosen are
+    # still paid for (three planner calls instead of one).
+    prefetch_planner = PlannerAgent(assistant.model, verbose=False)
+    prefetcher = ThreadPoolExecutor(max_workers=len(example_topics))
+    prefetched = {
+        topic: prefetcher.submit(prefetch_planner.create_research_plan, topic)
+        for topic in example_topics
+    }
+    
     print("📚 Example research topics:")
     for i, topic in enumerate(example_topics, 1):
         print(f"   {i}. {topic}")
@@ -101,6 +114,12 @@ def run_example_research():
     
     print(f"\n🎯 Selected topic: {selected_topic}")
     
+    # Wait for the selected plan so it is not requested twice. The other plans
+    # are already in flight and cannot be cancelled; they finish in the background
+    # and go through the shared rate limiter like every other request.
+    prefetched[selected_topic].result()
+    prefetcher.shutdown(wait=False)
+    
     # Conduct research
     report = assistant.conduct_research(selected_topic)
     
@@ -110,7 +129,7 @@ def run_example_research():
         # Save the example report
         save_choice = input("\n💾 Save this example report? (y/n): ").strip().lower()
         if save_choice in ['y', 'yes']:
-            from main import save_report_to_file
+            from util import save_report_to_file
             save_report_to_file(selected_topic, report)
     else:
         print(f"\n{report}")
@@ -159,6 +178,8 @@ def main():
     """
     Main function for example usage
     """
+    configure_logging(verbose="--verbose" in sys.argv)
+    
     print("🤖 Multi-Agent Research Assistant - Example Usage")
     print("=" * 60)
     
@@ -0,0 +1,152 @@
+"""
+Rate limiting helpers for the Multi-Agent System
+Keeps concurrent Gemini calls inside the request quota
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from google.api_core.exceptions import ResourceExhausted
+
+logger = logging.getLogger(__name__)
+
+# Attempts per Gemini call before a quota error is passed on to the caller
+MAX_ATTEMPTS = 5
+
+
+class TokenBucket:
+    """
+    Sliding-window rate limiter shared by all threads of the process.
+    Only blocks when the next call would exceed max_rate calls per period seconds.
+    """
+
+    def __init__(self, max_rate: int = 60, period: float = 60):
+        self.max_rate = max_rate
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request slot is available, then claim it
+        """
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Async version of acquire that yields to the event loop while waiting
+        """
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def _try_acquire(self) -> float:
+        """
+        Claim a slot if one is free
+
+        Returns:
+            float: 0 if a slot was claimed, otherwise the seconds until one frees up
+        """
+        with self._lock:
+            now = time.monotonic()
+            # Drop timestamps that have left the window
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+
+            if len(self._calls) < self.max_rate:
+                self._calls.append(now)
+                return 0
+
+            return self.period - (now - self._calls[0])
+
+
+def _limiter_from_env() -> TokenBucket:
+    """
+    Build the shared limiter: GEMINI_RPS requests per second if set (fractions
+    such as 0.5 allowed), otherwise 60 requests per minute
+    """
+    rps = os.getenv("GEMINI_RPS")
+    if rps:
+        try:
+            rate = float(rps)
+        except ValueError:
+            rate = 0
+        if rate > 0:
+            # Whole requests per window: 2.5 -> 2 per 0.8s, 0.5 -> 1 per 2s
+            max_rate = max(1, int(rate))
+            return TokenBucket(max_rate=max_rate, period=max_rate / rate)
+        logger.warning("⚠️  Ignoring invalid GEMINI_RPS=%r, using 60 requests per minute", rps)
+    return TokenBucket(max_rate=60, period=60)
+
+
+# Shared by every agent so the whole process stays under one quota. Built by
+# get_limiter() on the first call, once config has loaded .env
+gemini_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> TokenBucket:
+    """
+    The shared limiter, built from GEMINI_RPS on first use
+    """
+    global gemini_limiter
+    with _limiter_lock:
+        if gemini_limiter is None:
+            gemini_limiter = _limiter_from_env()
+        return gemini_limiter
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter, capped at one minute
+    """
+    return min(60, 2 ** attempt) + random.random()
+
+
+def call_with_backoff(fn, *args, **kwargs):
+    """
+    Call a Gemini API function once the rate limiter grants a slot, retrying
+    with exponential backoff when the API reports that the quota is exhausted
+
+    Args:
+        fn: The API function to call (e.g. model.generate_content)
+        *args, **kwargs: Arguments passed to fn
+
+    Returns:
+        The result of fn
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        get_limiter().acquire()
+        try:
+            return fn(*args, **kwargs)
+        except ResourceExhausted:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(_backoff_delay(attempt))
+
+
+async def call_with_backoff_async(fn, *args, **kwargs):
+    """
+    Async version of call_with_backoff for coroutine API functions
+    (e.g. model.generate_content_async)
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        await get_limiter().acquire_async()
+        try:
+            return await fn(*args, **kwargs)
+        except ResourceExhausted:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_backoff_delay(attempt))
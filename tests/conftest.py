@@ -0,0 +1,96 @@
+"""
+Shared fixtures for the offline test suite: no test talks to the Gemini API
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cache
+import limits
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeModel:
+    """
+    Stand-in for genai.GenerativeModel that answers every prompt with a fixed
+    text and records the prompts it was sent
+    """
+
+    model_name = "models/fake-model"
+
+    def __init__(self, text: str = "answer"):
+        self.text = text
+        self.prompts = []
+
+    def generate_content(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return FakeResponse(self.text)
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return FakeResponse(self.text)
+
+
+@pytest.fixture
+def fake_model():
+    return FakeModel()
+
+
+@pytest.fixture(autouse=True)
+def llm_cache(tmp_path, monkeypatch):
+    """
+    A fresh on-disk LLMCache in a temporary directory, installed as the shared
+    response cache together with an empty in-memory tier (for every test, so
+    none of them reads or writes the real .llm_cache)
+    """
+    fresh = cache.LLMCache(path=str(tmp_path / "cache.sqlite3"),
+                           namespace_thresholds=cache._NAMESPACE_THRESHOLDS)
+    monkeypatch.setattr(cache, "response_cache", fresh)
+    monkeypatch.setattr(cache, "_memory_cache", cache._LRUCache(cache.MEMORY_CACHE_SIZE))
+    return fresh
+
+
+@pytest.fixture(autouse=True)
+def unlimited_rate(monkeypatch):
+    """
+    Give every test its own limiter with a quota the suite cannot exhaust
+    """
+    monkeypatch.setattr(limits, "gemini_limiter", limits.TokenBucket(max_rate=10_000, period=60))
+
+
+class FakeEmbeddings:
+    """
+    Stand-in for genai.embed_content backed by a lookup table of
+    {embedding text: vector} with three dimensions; every text missing from
+    the table gets its own one-hot vector, orthogonal to all other texts
+    """
+
+    def __init__(self):
+        self.vectors = {}
+        self.requests = []
+
+    def embed_content(self, model, content):
+        self.requests.extend(content)
+        return {"embedding": [self._vector(text) for text in content]}
+
+    def _vector(self, text):
+        if text not in self.vectors:
+            vector = [0.0] * (3 + len(self.vectors) + 1)
+            vector[-1] = 1.0
+            self.vectors[text] = vector
+        return self.vectors[text]
+
+
+@pytest.fixture(autouse=True)
+def embeddings(monkeypatch):
+    fake = FakeEmbeddings()
+    monkeypatch.setattr(cache.genai, "embed_content", fake.embed_content)
+    return fake
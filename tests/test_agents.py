@@ -0,0 +1,222 @@
+"""
+Tests for the agents' response parsing and batched research fallbacks
+"""
+
+import asyncio
+
+import pytest
+
+from agents import PlannerAgent, SearchAgent, SynthesizerAgent
+
+
+@pytest.fixture
+def planner(fake_model):
+    return PlannerAgent(fake_model, verbose=False)
+
+
+@pytest.fixture
+def searcher(fake_model):
+    return SearchAgent(fake_model)
+
+
+@pytest.fixture
+def synthesizer(fake_model):
+    return SynthesizerAgent(fake_model)
+
+
+QUESTIONS = [
+    "What are the environmental benefits of solar power?",
+    "How much does a rooftop solar installation cost?",
+]
+
+
+def test_extract_questions_reads_json_array(planner):
+    assert planner._extract_questions('["%s", "%s"]' % tuple(QUESTIONS)) == QUESTIONS
+
+
+def test_extract_questions_reads_fenced_json(planner):
+    text = '```json\n["%s", "%s"]\n```' % tuple(QUESTIONS)
+    assert planner._extract_questions(text) == QUESTIONS
+
+
+def test_extract_questions_drops_short_items_and_keeps_five(planner):
+    questions = ["Question number %s about solar power?" % i for i in range(7)]
+    text = '["ok", %s]' % ", ".join('"%s"' % q for q in questions)
+    assert planner._extract_questions(text) == questions[:5]
+
+
+def test_extract_questions_falls_back_to_numbered_lines(planner):
+    text = "Here is the plan:\n1. %s\n2. - %s\n" % tuple(QUESTIONS)
+    assert planner._extract_questions(text) == QUESTIONS
+
+
+def test_parse_answers_reads_json_array(searcher):
+    assert searcher._parse_answers('["a", "b"]', 2) == ["a", "b"]
+
+
+def test_parse_answers_reads_fenced_json(searcher):
+    assert searcher._parse_answers('```json\n["a", "b"]\n```', 2) == ["a", "b"]
+
+
+@pytest.mark.parametrize("text", [
+    '["a"]',            # wrong number of answers
+    '["a", ""]',        # empty answer
+    '["a", 2]',         # not a string
+    '{"a": "b"}',       # not a list
+    "1. a\n2. b",       # not JSON
+    "",
+])
+def test_parse_answers_rejects_unusable_responses(searcher, text):
+    assert searcher._parse_answers(text, 2) == []
+
+
+def test_unparseable_grounded_batch_is_not_answered_ungrounded(searcher, monkeypatch):
+    requests = []
+
+    async def invoke(prompt, use_search=True, generation_config=None):
+        requests.append(use_search)
+        return "Free-form grounded text that is not a JSON array"
+
+    monkeypatch.setattr(searcher, "_invoke_async", invoke)
+
+    assert asyncio.run(searcher.research_questions_async(QUESTIONS)) == []
+    assert requests == [True]
+
+
+def test_failed_search_falls_back_to_json_batch(searcher, monkeypatch):
+    requests = []
+
+    async def invoke(prompt, use_search=True, generation_config=None):
+        requests.append(use_search)
+        if use_search:
+            raise RuntimeError("search unavailable")
+        return '["first answer", "second answer"]'
+
+    monkeypatch.setattr(searcher, "_invoke_async", invoke)
+
+    assert asyncio.run(searcher.research_questions_async(QUESTIONS)) == ["first answer", "second answer"]
+    assert requests == [True, False]
+
+
+def test_individual_research_is_cached_once_per_question(searcher, llm_cache, embeddings):
+    answers = asyncio.run(searcher.research_questions_batch_async(QUESTIONS))
+
+    assert answers == ["answer", "answer"]
+    # One agent-level and one raw-prompt miss per question
+    assert llm_cache.stats["misses"] == 2 * len(QUESTIONS)
+    assert len(llm_cache._index["search"]) == len(QUESTIONS)
+
+
+def test_search_variants_send_their_own_batch_prompts(fake_model):
+    from google_search_research import GoogleSearchAgent
+    from simple_research import SimpleSearchAgent
+
+    prompts = set()
+    for agent_cls in (SearchAgent, GoogleSearchAgent, SimpleSearchAgent):
+        agent = agent_cls(fake_model)
+        prompts.add(agent.batch_search_prompt)
+        prompts.add(agent.batch_fallback_prompt)
+
+    assert None in prompts
+    assert len(prompts) == 6
+
+
+class ScriptedInvoke:
+    """
+    Replacement for _invoke/_invoke_async: answers the grounded and the
+    fallback request from a script, where an exception instance is raised
+    """
+
+    def __init__(self, grounded, fallback):
+        self.script = {True: grounded, False: fallback}
+        self.requests = []
+
+    def __call__(self, prompt, use_search=True, generation_config=None):
+        self.requests.append(use_search)
+        outcome = self.script[use_search]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def call_async(self, prompt, use_search=True, generation_config=None):
+        return self(prompt, use_search, generation_config)
+
+
+@pytest.mark.parametrize("grounded, fallback, expected, requests", [
+    ("grounded answer", "fallback answer", "grounded answer", [True]),
+    ("", "fallback answer", "fallback answer", [True, False]),
+    (RuntimeError("search down"), "fallback answer", "fallback answer", [True, False]),
+    (RuntimeError("search down"), RuntimeError("model down"), "", [True, False]),
+])
+def test_research_question_falls_back_from_search_to_knowledge(
+        searcher, llm_cache, embeddings, monkeypatch, grounded, fallback, expected, requests):
+    sync_invoke = ScriptedInvoke(grounded, fallback)
+    async_invoke = ScriptedInvoke(grounded, fallback)
+    monkeypatch.setattr(searcher, "_invoke", sync_invoke)
+    monkeypatch.setattr(searcher, "_invoke_async", async_invoke.call_async)
+
+    # Different wording per call so the second one is not answered from the cache
+    assert searcher.research_question("What is solar power used for?") == expected
+    assert asyncio.run(searcher.research_question_async("How is wind power stored?")) == expected
+    assert sync_invoke.requests == async_invoke.requests == requests
+
+
+def test_final_report_errors_are_returned_as_messages(synthesizer, monkeypatch):
+    assert synthesizer.create_final_report("topic", []).startswith("Error: No research data")
+
+    async def fail(prompt, **kwargs):
+        raise RuntimeError("model down")
+
+    monkeypatch.setattr(synthesizer.model, "generate_content_async", fail)
+    report = asyncio.run(synthesizer.create_final_report_async("topic", [("q", "a")]))
+    assert report == "Error: Could not generate the final report."
+
+
+class Chunk:
+    def __init__(self, text):
+        self._text = text
+
+    @property
+    def text(self):
+        if self._text is None:
+            # What the SDK raises for chunks without text parts
+            raise ValueError("no text")
+        return self._text
+
+
+STREAM = [Chunk("The "), Chunk(None), Chunk("report"), Chunk("")]
+
+
+def test_streamed_report_is_forwarded_chunk_by_chunk_and_cached(synthesizer, llm_cache, monkeypatch):
+    async def generate_stream(prompt, stream=False):
+        async def chunks():
+            for chunk in STREAM:
+                yield chunk
+        return chunks()
+
+    monkeypatch.setattr(synthesizer.model, "generate_content_async", generate_stream)
+    received = []
+
+    report = asyncio.run(synthesizer.create_final_report_async("topic", [("q", "a")], received.append))
+    assert report == "The report"
+    assert received == ["The ", "report"]
+
+    # A repeat is replayed from the cache in one piece
+    received.clear()
+    assert synthesizer.create_final_report("topic", [("q", "a")], received.append) == "The report"
+    assert received == ["The report"]
+
+
+def test_sync_streamed_report_matches_async(synthesizer, llm_cache, monkeypatch):
+    monkeypatch.setattr(synthesizer.model, "generate_content", lambda prompt, stream=False: iter(STREAM))
+    received = []
+
+    assert synthesizer.create_final_report("topic", [("q", "a")], received.append) == "The report"
+    assert received == ["The ", "report"]
+
+
+def test_empty_stream_reports_an_error(synthesizer, llm_cache, monkeypatch):
+    monkeypatch.setattr(synthesizer.model, "generate_content", lambda prompt, stream=False: iter([]))
+
+    report = synthesizer.create_final_report("topic", [("q", "a")], lambda text: None)
+    assert report == "Error: Could not generate the final report."
@@ -0,0 +1,87 @@
+"""
+Tests for ResearchAssistant's session reuse of answers and result ordering
+"""
+
+import asyncio
+
+from assistant import ResearchAssistant
+
+
+class FakePlanner:
+    def __init__(self, plans):
+        self.plans = plans
+
+    async def create_research_plan_async(self, topic):
+        return self.plans[topic]
+
+
+class FakeSearcher:
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+
+    async def research_questions_batch_async(self, questions):
+        self.calls.append(list(questions))
+        return ["" if q in self.missing else "answer to " + q for q in questions]
+
+
+class FakeSynthesizer:
+    def __init__(self):
+        self.results = []
+
+    async def create_final_report_async(self, topic, research_results):
+        self.results.append(research_results)
+        return "report on " + topic
+
+
+def make_assistant(plans, missing=()):
+    assistant = ResearchAssistant()
+    assistant.model = object()
+    assistant.planner = FakePlanner(plans)
+    assistant.searcher = FakeSearcher(missing)
+    assistant.synthesizer = FakeSynthesizer()
+    return assistant
+
+
+def test_repeated_questions_are_researched_once_in_plan_order():
+    assistant = make_assistant({"solar": ["Why solar?", "How much?", "why  SOLAR?", "Who?"]})
+
+    assert asyncio.run(assistant.conduct_research_async("solar")) == "report on solar"
+    assert assistant.searcher.calls == [["Why solar?", "How much?", "Who?"]]
+    assert assistant.synthesizer.results == [[
+        ("Why solar?", "answer to Why solar?"),
+        ("How much?", "answer to How much?"),
+        ("Who?", "answer to Who?"),
+    ]]
+
+
+def test_answers_are_reused_across_topics_in_a_session():
+    assistant = make_assistant({"solar": ["Why solar?", "How much?"],
+                                "wind": ["How much?", "Why wind?"]})
+
+    asyncio.run(assistant.conduct_research_async("solar"))
+    asyncio.run(assistant.conduct_research_async("wind"))
+
+    assert assistant.searcher.calls == [["Why solar?", "How much?"], ["Why wind?"]]
+    assert assistant.synthesizer.results[1] == [
+        ("How much?", "answer to How much?"),
+        ("Why wind?", "answer to Why wind?"),
+    ]
+
+
+def test_questions_without_answers_are_skipped_and_retried_later():
+    assistant = make_assistant({"solar": ["Why solar?", "How much?"]}, missing={"How much?"})
+
+    asyncio.run(assistant.conduct_research_async("solar"))
+    assert assistant.synthesizer.results == [[("Why solar?", "answer to Why solar?")]]
+
+    assistant.searcher.missing.clear()
+    asyncio.run(assistant.conduct_research_async("solar"))
+    assert assistant.searcher.calls[-1] == ["How much?"]
+
+
+def test_questions_differing_in_punctuation_are_kept_apart():
+    assistant = make_assistant({"languages": ["What is C++?", "What is C?"]})
+
+    asyncio.run(assistant.conduct_research_async("languages"))
+    assert assistant.searcher.calls == [["What is C++?", "What is C?"]]
@@ -0,0 +1,259 @@
+"""
+Tests for the response cache: key normalization, the exact and semantic
+tiers, expiry and coalescing of identical in-flight requests
+"""
+
+import asyncio
+import math
+
+import pytest
+
+import cache
+import limits
+from cache import normalize_text
+
+
+def similar_vector(similarity: float):
+    """
+    Vector with the given cosine similarity to [1, 0, 0]
+    """
+    return [similarity, math.sqrt(1 - similarity ** 2), 0.0]
+
+
+def test_normalize_text_folds_case_and_whitespace():
+    assert normalize_text("  What IS\tsolar\n power? ") == "what is solar power?"
+
+
+@pytest.mark.parametrize("first, second", [("C++", "C"), ("C#", "C"), ("3.5%", "35%")])
+def test_normalize_text_keeps_punctuation_that_changes_meaning(first, second):
+    assert normalize_text(first) != normalize_text(second)
+
+
+def test_embedding_text_drops_punctuation():
+    assert cache._embedding_text("What is solar power?") == "what is solar power"
+
+
+def test_exact_tier_round_trip(llm_cache, embeddings):
+    llm_cache.put("generate", "prompt", "response")
+
+    assert llm_cache.get("generate", "prompt") == "response"
+    assert llm_cache.get("generate", "other prompt") is None
+    assert embeddings.requests == []
+
+
+def test_lookup_prefers_exact_match_without_embedding(llm_cache, embeddings):
+    llm_cache.store("search", "what is solar power?", '"answer"', embedding=[1.0, 0.0, 0.0])
+
+    assert llm_cache.lookup("search", "what is solar power?") == ('"answer"', None)
+    assert embeddings.requests == []
+    assert llm_cache.stats["hits"] == 1
+
+
+def test_semantic_tier_reuses_similar_questions(llm_cache, embeddings):
+    embeddings.vectors["what is solar power"] = [1.0, 0.0, 0.0]
+    embeddings.vectors["what is solar energy"] = similar_vector(0.97)
+    embeddings.vectors["what is wind power"] = similar_vector(0.5)
+    llm_cache.store("search", "what is solar power?", '"answer"')
+
+    assert llm_cache.lookup("search", "what is solar energy?")[0] == '"answer"'
+    assert llm_cache.lookup("search", "what is wind power?")[0] is None
+    assert llm_cache.stats["semantic_hits"] == 1
+
+
+def test_semantic_threshold_is_stricter_for_plans(llm_cache, embeddings):
+    embeddings.vectors["solar power"] = [1.0, 0.0, 0.0]
+    embeddings.vectors["solar energy"] = similar_vector(0.93)
+    llm_cache.store("planner", "solar power", '["plan"]')
+    llm_cache.store("search", "solar power", '"answer"')
+
+    assert llm_cache.lookup("planner", "solar energy")[0] is None
+    assert llm_cache.lookup("search", "solar energy")[0] == '"answer"'
+
+
+def test_entries_expire_after_ttl(llm_cache, embeddings, monkeypatch):
+    embeddings.vectors["solar power"] = [1.0, 0.0, 0.0]
+    llm_cache.store("search", "solar power", '"answer"')
+    stored_at = cache.time.time()
+
+    monkeypatch.setattr(cache.time, "time", lambda: stored_at + llm_cache.ttl + 1)
+
+    assert llm_cache.lookup("search", "solar power") == (None, [1.0, 0.0, 0.0])
+    assert llm_cache.get("search", "solar power") is None
+
+
+def test_expired_entries_are_purged_and_not_indexed(llm_cache, embeddings, monkeypatch):
+    embeddings.vectors["old question"] = [1.0, 0.0, 0.0]
+    llm_cache.store("search", "old question", '"old answer"')
+    expired_at = cache.time.time() + llm_cache.ttl + 1
+    monkeypatch.setattr(cache.time, "time", lambda: expired_at)
+
+    # Expired rows are not loaded into the in-memory index...
+    llm_cache._index.clear()
+    assert llm_cache._load_index("search", expired_at - llm_cache.ttl) == {}
+
+    # ...and are deleted when the file is opened again
+    reopened = cache.LLMCache(path=llm_cache.path)
+    assert reopened._connect().execute("SELECT COUNT(*) FROM responses").fetchone() == (0,)
+
+
+def test_cached_generate_async_coalesces_identical_requests(llm_cache, fake_model, monkeypatch):
+    waiters = 0
+    all_waiting = None
+    release = None
+    original = fake_model.generate_content_async
+
+    class InflightRequests(dict):
+        # Signals once both later callers have found the first caller's request
+        def get(self, key, default=None):
+            nonlocal waiters
+            pending = super().get(key, default)
+            if pending is not None:
+                waiters += 1
+                if waiters == 2:
+                    all_waiting.set()
+            return pending
+
+    async def slow_generate(prompt, **kwargs):
+        await release.wait()
+        return await original(prompt, **kwargs)
+
+    monkeypatch.setattr(cache, "_inflight", InflightRequests())
+    fake_model.generate_content_async = slow_generate
+
+    async def run():
+        nonlocal all_waiting, release
+        all_waiting, release = asyncio.Event(), asyncio.Event()
+        tasks = [asyncio.create_task(cache.cached_generate_async(fake_model, "prompt"))
+                 for _ in range(3)]
+        await all_waiting.wait()
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == ["answer"] * 3
+    assert fake_model.prompts == ["prompt"]
+    assert cache._inflight == {}
+
+
+class Doubler:
+    """
+    Minimal agent whose batched method doubles each text and records its inputs
+    """
+
+    name = "Doubler"
+    cache_namespace = "double"
+
+    def __init__(self):
+        self.calls = []
+
+    @cache.cached_many()
+    async def double_all(self, texts):
+        self.calls.append(list(texts))
+        return [text * 2 for text in texts]
+
+
+def test_cached_many_only_sends_misses_and_keeps_order(llm_cache, embeddings):
+    agent = Doubler()
+    asyncio.run(agent.double_all(["b", "d"]))
+
+    assert asyncio.run(agent.double_all(["a", "b", "c", "d"])) == ["aa", "bb", "cc", "dd"]
+    assert agent.calls == [["b", "d"], ["a", "c"]]
+
+
+def test_cached_many_does_not_cache_empty_results(llm_cache, embeddings):
+    agent = Doubler()
+    asyncio.run(agent.double_all(["", "x"]))
+    asyncio.run(agent.double_all(["", "x"]))
+
+    assert agent.calls == [["", "x"], [""]]
+
+
+def test_cached_generate_async_serves_repeats_from_cache(llm_cache, fake_model):
+    async def run():
+        first = await cache.cached_generate_async(fake_model, "prompt", generation_config={"a": 1})
+        second = await cache.cached_generate_async(fake_model, "prompt", generation_config={"a": 1})
+        other = await cache.cached_generate_async(fake_model, "prompt", generation_config={"a": 2})
+        return first, second, other
+
+    assert asyncio.run(run()) == ("answer", "answer", "answer")
+    assert len(fake_model.prompts) == 2
+
+
+def test_cancelling_the_sender_does_not_cancel_waiters(fake_model, monkeypatch):
+    started = None
+    release = None
+    original = fake_model.generate_content_async
+
+    async def slow_generate(prompt, **kwargs):
+        started.set()
+        await release.wait()
+        return await original(prompt, **kwargs)
+
+    class InflightRequests(dict):
+        def get(self, key, default=None):
+            pending = super().get(key, default)
+            if pending is not None:
+                waiting.set()
+            return pending
+
+    monkeypatch.setattr(cache, "_inflight", InflightRequests())
+    fake_model.generate_content_async = slow_generate
+
+    async def run():
+        nonlocal started, release, waiting
+        started, release, waiting = asyncio.Event(), asyncio.Event(), asyncio.Event()
+        sender = asyncio.create_task(cache.cached_generate_async(fake_model, "prompt"))
+        await started.wait()
+        waiter = asyncio.create_task(cache.cached_generate_async(fake_model, "prompt"))
+        await waiting.wait()
+
+        sender.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await sender
+        return await waiter
+
+    waiting = None
+    assert asyncio.run(run()) == "answer"
+    # The waiter sent the request again after the sender was cancelled
+    assert fake_model.prompts == ["prompt"]
+
+
+def test_failed_embeddings_are_not_retried_on_every_lookup(llm_cache, monkeypatch):
+    requests = []
+    now = [1000.0]
+
+    def failing_embed(model, content):
+        requests.append(content)
+        raise RuntimeError("embedding quota exhausted")
+
+    monkeypatch.setattr(cache.genai, "embed_content", failing_embed)
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+    assert llm_cache.lookup("search", "first question") == (None, None)
+    assert llm_cache.lookup("search", "second question") == (None, None)
+    assert len(requests) == 1
+
+    now[0] += cache.EMBEDDING_RETRY_DELAY
+    llm_cache.lookup("search", "third question")
+    assert len(requests) == 2
+
+
+def test_embeddings_go_through_the_rate_limiter(llm_cache, embeddings, monkeypatch):
+    acquired = []
+    monkeypatch.setattr(limits.gemini_limiter, "acquire", lambda: acquired.append(True))
+
+    llm_cache.lookup("search", "a question")
+
+    assert acquired == [True]
+
+
+def test_search_threshold_is_read_on_first_lookup(llm_cache, embeddings, monkeypatch):
+    cache._threshold_from_env.cache_clear()
+    monkeypatch.setenv("LLMCACHE_SEMANTIC_THRESHOLD", "0.6")
+    embeddings.vectors["solar power"] = [1.0, 0.0, 0.0]
+    embeddings.vectors["wind power"] = similar_vector(0.7)
+    try:
+        llm_cache.store("search", "solar power", '"answer"')
+        assert llm_cache.lookup("search", "wind power")[0] == '"answer"'
+    finally:
+        cache._threshold_from_env.cache_clear()
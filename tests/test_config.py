@@ -0,0 +1,36 @@
+"""
+Tests for logging setup
+"""
+
+import logging
+
+import pytest
+
+import config
+
+
+@pytest.fixture
+def restore_levels():
+    loggers = [logging.getLogger(name) for name in ("agents", "cache", "config", "limits", "asyncio")]
+    levels = [logger.level for logger in loggers]
+    yield
+    for logger, level in zip(loggers, levels):
+        logger.setLevel(level)
+
+
+def test_unknown_loglevel_falls_back_to_info(monkeypatch, caplog, restore_levels):
+    monkeypatch.setenv("LOGLEVEL", "verbose")
+
+    config.configure_logging()
+
+    assert "Ignoring unknown LOGLEVEL='VERBOSE'" in caplog.text
+
+
+def test_verbose_covers_every_project_module_and_no_library(restore_levels):
+    import agents  # noqa: F401 - loads cache and limits as well
+
+    config.configure_logging(verbose=True)
+
+    for name in ("agents", "cache", "limits", "config"):
+        assert logging.getLogger(name).level == logging.DEBUG
+    assert logging.getLogger("asyncio").level != logging.DEBUG
@@ -0,0 +1,68 @@
+"""
+Tests for the sliding-window rate limiter
+"""
+
+import asyncio
+
+import limits
+from limits import TokenBucket
+
+
+def test_token_bucket_grants_max_rate_slots_per_window():
+    bucket = TokenBucket(max_rate=2, period=10)
+
+    assert bucket._try_acquire() == 0
+    assert bucket._try_acquire() == 0
+    wait = bucket._try_acquire()
+    assert 0 < wait <= 10
+
+
+def test_token_bucket_frees_slots_once_they_leave_the_window(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(limits.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(max_rate=1, period=5)
+
+    assert bucket._try_acquire() == 0
+    now[0] += 2
+    assert bucket._try_acquire() == 3
+    now[0] += 3
+    assert bucket._try_acquire() == 0
+
+
+def test_token_bucket_acquire_async_sleeps_until_a_slot_frees(monkeypatch):
+    bucket = TokenBucket(max_rate=1, period=60)
+    waits = iter([0, 1.5, 0])
+    slept = []
+    monkeypatch.setattr(bucket, "_try_acquire", lambda: next(waits))
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(limits.asyncio, "sleep", fake_sleep)
+
+    async def acquire_twice():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    asyncio.run(acquire_twice())
+    assert slept == [1.5]
+
+
+def test_limiter_from_env_accepts_fractional_rates(monkeypatch):
+    monkeypatch.setenv("GEMINI_RPS", "0.5")
+    bucket = limits._limiter_from_env()
+    assert (bucket.max_rate, bucket.period) == (1, 2)
+
+
+def test_limiter_from_env_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("GEMINI_RPS", "fast")
+    bucket = limits._limiter_from_env()
+    assert (bucket.max_rate, bucket.period) == (60, 60)
+
+
+def test_shared_limiter_reads_gemini_rps_on_first_use(monkeypatch):
+    monkeypatch.setattr(limits, "gemini_limiter", None)
+    monkeypatch.setenv("GEMINI_RPS", "4")
+
+    assert limits.get_limiter().max_rate == 4
+    assert limits.get_limiter() is limits.gemini_limiter
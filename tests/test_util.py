@@ -0,0 +1,39 @@
+"""
+Tests for saving reports to disk
+"""
+
+from util import save_report_to_file
+
+
+def saved_files(directory):
+    return [path.name for path in directory.iterdir()]
+
+
+def test_report_filename_keeps_only_safe_characters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    save_report_to_file('AI: "risks" / rewards?', "body", prefix="report")
+
+    [name] = saved_files(tmp_path)
+    assert name.startswith("report_AI_risks__rewards_")
+    assert name.endswith(".txt")
+
+
+def test_report_filename_keeps_non_ascii_letters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    save_report_to_file("Énergie solaire: coûts", "body")
+
+    [name] = saved_files(tmp_path)
+    assert name.startswith("research_report_Énergie_solaire_coûts_")
+
+
+def test_report_file_has_title_and_body(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    save_report_to_file("solar", "The report body", title="Google Search Research Report")
+
+    [name] = saved_files(tmp_path)
+    text = (tmp_path / name).read_text(encoding="utf-8")
+    assert text.startswith("Google Search Research Report: solar\n")
+    assert text.endswith("\n\nThe report body")
@@ -0,0 +1,49 @@
+"""
+Shared helpers for the Multi-Agent Research Assistant entry points
+"""
+
+import string
+import time
+from pathlib import Path
+
+# Deletes every ASCII character that is not allowed in a report filename
+_FILENAME_KEEP = set(string.ascii_letters + string.digits + ' -_')
+_FILENAME_TRANS = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _FILENAME_KEEP))
+
+
+def save_report_to_file(topic: str, report: str, prefix: str = "research_report",
+                        title: str = "Research Report"):
+    """
+    Save the research report to a text file
+    
+    Args:
+        topic (str): The research topic
+        report (str): The report content
+        prefix (str): Start of the file name (e.g. "google_search_report")
+        title (str): Heading written above the report
+    """
+    try:
+        # Create filename from topic
+        if topic.isascii():
+            safe_topic = topic.translate(_FILENAME_TRANS)
+        else:
+            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_'))
+        safe_topic = safe_topic.rstrip().replace(' ', '_')
+        filename = f"{prefix}_{safe_topic}_{int(time.time())}.txt"
+        
+        # Build the whole file first so it is written in a single call
+        separator = "=" * 50
+        body = (
+            f"{title}: {topic}\n"
+            f"{separator}\n"
+            f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{separator}\n\n"
+            f"{report}"
+        )
+        Path(filename).write_text(body, encoding='utf-8')
+        
+        print(f"✅ Report saved as: {filename}")
+        
+    except Exception as e:
+        print(f"❌ Failed to save report: {e}")
+